@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import weakref
+from time import monotonic
+
+from gi.repository import GLib
+from loguru import logger as log
+
+
+class RenderCoordinator:
+    # Actions with rotating content (metrics) advance one phase every
+    # PHASE_TICKS ticks; a new phase triggers a render pass like a status
+    # change does.
+    PHASE_TICKS = 3
+    # Every action instance forwards its on_tick; ticks closer together than
+    # this belong to the same round.
+    TICK_ROUND_SECONDS = 0.5
+
+    def __init__(self, plugin) -> None:
+        self._plugin = plugin
+        self._actions: weakref.WeakSet = weakref.WeakSet()
+        self._tick_count = 0
+        self._last_tick = 0.0
+        self._pass_scheduled = False
+        self._force_next = False
+        self._rendered_key: tuple | None = None
+
+    @property
+    def phase(self) -> int:
+        return self._tick_count // self.PHASE_TICKS
+
+    def register(self, action) -> None:
+        self._actions.add(action)
+        self.request_render(force=True)
+
+    def on_tick(self) -> None:
+        now = monotonic()
+        if now - self._last_tick < self.TICK_ROUND_SECONDS:
+            return
+        self._last_tick = now
+        self._tick_count += 1
+        # Ticks arrive on the deck's tick thread, so a status RPC (when
+        # there is no status channel) blocks here rather than the pass.
+        self._plugin.refresh_backend_status()
+        self.request_render()
+
+    def request_render(self, force: bool = False) -> None:
+        # Safe from any thread: the pass itself always runs on the GLib
+        # main loop, and several requests collapse into one pass. The pass
+        # only reads already-available status; it never waits on the backend.
+        self._force_next = self._force_next or force
+        if self._pass_scheduled:
+            return
+        self._pass_scheduled = True
+        GLib.idle_add(self._render_pass)
+
+    def _render_pass(self) -> bool:
+        self._pass_scheduled = False
+        force, self._force_next = self._force_next, False
+
+        version, status = self._plugin.read_backend_status()
+        phase = self.phase
+        key = (version, phase)
+        if not force and key == self._rendered_key:
+            return False
+        self._rendered_key = key
+
+        for action in list(self._actions):
+            if not self._is_visible(action):
+                continue
+            try:
+                action.apply_visuals(action.compute_visuals(status, phase))
+            except Exception as exc:  # noqa: BLE001
+                log.error(exc)
+        return False
+
+    @staticmethod
+    def _is_visible(action) -> bool:
+        is_present = getattr(action, "get_is_present", None)
+        if is_present is None:
+            return True
+        try:
+            return bool(is_present())
+        except Exception:
+            return True
@@ -1,11 +1,111 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from time import monotonic
+
+from gi.repository import GLib
+
 from src.backend.PluginManager.ActionBase import ActionBase
 
 
+@dataclass(frozen=True, slots=True)
+class ActionVisuals:
+    icon: str
+    top: str = ""
+    center: str = ""
+    bottom: str = ""
+    # Key state index for multi-state actions; None leaves the state alone.
+    state: int | None = None
+
+
 class WalkingPadActionBase(ActionBase):
     ICON_SIZE_DEFAULT = 0.6
     ICON_SIZE_LARGE = 0.75
+    OFFLINE_ICON = "offline"
+    ERROR_SECONDS = 2
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._applied_visuals: ActionVisuals | None = None
+        self._error_until = 0.0
+
+    def on_ready(self) -> None:
+        self._applied_visuals = None
+        coordinator = self.get_render_coordinator()
+        if coordinator is None:
+            self.apply_visuals(self.compute_visuals(self.get_backend_status(), 0))
+            return
+        coordinator.register(self)
+
+    def on_tick(self) -> None:
+        coordinator = self.get_render_coordinator()
+        if coordinator is not None:
+            coordinator.on_tick()
+
+    def compute_visuals(self, status: dict | None, phase: int) -> ActionVisuals:
+        raise NotImplementedError
+
+    def apply_visuals(self, visuals: ActionVisuals) -> None:
+        if monotonic() < self._error_until:
+            # Keep the error image up; _on_error_expired redraws afterwards.
+            return
+
+        # Only touch the deck for parts that actually changed.
+        previous = self._applied_visuals
+        if visuals == previous:
+            return
+
+        if visuals.state is not None and (previous is None or previous.state != visuals.state):
+            self._set_input_state(visuals.state)
+            previous = self._applied_visuals
+        if previous is None or previous.icon != visuals.icon:
+            self.set_icon(visuals.icon)
+        if previous is None or previous.top != visuals.top:
+            self.set_top_label(visuals.top)
+        if previous is None or previous.center != visuals.center:
+            self.set_center_label(visuals.center)
+        if previous is None or previous.bottom != visuals.bottom:
+            self.set_bottom_label(visuals.bottom)
+        self._applied_visuals = visuals
+
+    def request_render(self) -> None:
+        # Called after key commands, off the GLib main loop.
+        plugin = getattr(self, "plugin_base", None)
+        if plugin is not None:
+            plugin.refresh_backend_status()
+        coordinator = self.get_render_coordinator()
+        if coordinator is None:
+            self.apply_visuals(self.compute_visuals(self.get_backend_status(), 0))
+            return
+        coordinator.request_render(force=True)
+
+    def show_error(self, duration: int = ERROR_SECONDS) -> None:
+        # The error image replaces whatever was drawn, so the next render
+        # must redraw every part instead of diffing against stale visuals.
+        self._applied_visuals = None
+        self._error_until = monotonic() + duration
+        super().show_error(duration=duration)
+        GLib.timeout_add_seconds(duration, self._on_error_expired)
+
+    def _on_error_expired(self) -> bool:
+        self._error_until = 0.0
+        coordinator = self.get_render_coordinator()
+        if coordinator is None:
+            self.apply_visuals(self.compute_visuals(self.get_backend_status(), 0))
+        else:
+            coordinator.request_render(force=True)
+        return False
+
+    def _set_input_state(self, target_state: int) -> None:
+        try:
+            c_input = self.get_input()
+            if c_input is not None and target_state in c_input.states and c_input.state != target_state:
+                c_input.set_state(target_state, update_sidebar=False)
+                # A state switch swaps the rendered media; redraw everything.
+                self._applied_visuals = None
+        except Exception:
+            # UI state switching failure should never block control.
+            pass
 
     def set_icon(self, icon_key: str, size: float | None = None) -> None:
         icon_size = size or self.ICON_SIZE_DEFAULT
@@ -19,6 +119,9 @@ class WalkingPadActionBase(ActionBase):
         self.set_center_label("")
         self.set_bottom_label("")
 
+    def get_render_coordinator(self):
+        return getattr(getattr(self, "plugin_base", None), "render_coordinator", None)
+
     def get_backend(self):
         plugin = getattr(self, "plugin_base", None)
         if plugin is None:
@@ -26,10 +129,8 @@ class WalkingPadActionBase(ActionBase):
         return getattr(plugin, "backend", None)
 
     def get_backend_status(self) -> dict | None:
-        backend = self.get_backend()
-        if backend is None:
-            return None
-        try:
-            return backend.get_status()
-        except Exception:
+        plugin = getattr(self, "plugin_base", None)
+        if plugin is None:
             return None
+        _version, status = plugin.read_backend_status()
+        return status
@@ -2,27 +2,117 @@ from __future__ import annotations
 
 import asyncio
 import concurrent.futures
+import json
+import os
 import threading
 from datetime import timedelta
+from time import monotonic, perf_counter, time
+from typing import TYPE_CHECKING
 
-from loguru import logger as log
-from streamcontroller_plugin_tools import BackendBase
+try:
+    from .startup_timing import StartupTimer
+except ImportError:
+    # Allow direct script execution (no package context)
+    from startup_timing import StartupTimer
+
+_startup = StartupTimer()
 
-from miwalkingpad import AsyncWalkingPadService, WalkingPadAdapter
-from miwalkingpad.discovery import discover_handshake
+with _startup.phase("import_base"):
+    from loguru import logger as log
+    from streamcontroller_plugin_tools import BackendBase
+
+if TYPE_CHECKING:
+    from miwalkingpad import AsyncWalkingPadService
 
 try:
-    from .service_compat import patch_async_service
-    from .status_types import BackendStatusCache, BackendStatusPayload
+    from .data_paths import plugin_data_dir
+    from .footprint import LOW_MEMORY_STACK_SIZE, footprint_report, rss_bytes, trim_memory
+    from .event_log import EventLog, use_enqueued_sink
+    from .loop_monitor import LoopLagMonitor
+    from .reconnect_policy import ReconnectPolicy, probe_miio_alive
+    from .sampling_profiler import SamplingProfiler
+    from .session_pool import SessionPool, WalkingPadSession
+    from .status_channel import StatusChannelWriter
+    from .status_store import StatusSnapshotStore
+    from .status_types import (
+        BackendStatusCache,
+        BackendStatusPayload,
+        BatchStepResult,
+        PendingIntent,
+        PendingIntentPayload,
+    )
+    from .workout_program import (
+        PROGRAM_COMPLETED,
+        PROGRAM_FAILED,
+        PROGRAM_GOAL_REACHED,
+        PROGRAM_RUNNING,
+        PROGRAM_STOPPED,
+        ProgramProgress,
+        WorkoutProgram,
+    )
 except ImportError:
     # Allow direct script execution (no package context)
-    from service_compat import patch_async_service
-    from status_types import BackendStatusCache, BackendStatusPayload
+    from data_paths import plugin_data_dir
+    from footprint import LOW_MEMORY_STACK_SIZE, footprint_report, rss_bytes, trim_memory
+    from event_log import EventLog, use_enqueued_sink
+    from loop_monitor import LoopLagMonitor
+    from reconnect_policy import ReconnectPolicy, probe_miio_alive
+    from sampling_profiler import SamplingProfiler
+    from session_pool import SessionPool, WalkingPadSession
+    from status_channel import StatusChannelWriter
+    from status_store import StatusSnapshotStore
+    from status_types import (
+        BackendStatusCache,
+        BackendStatusPayload,
+        BatchStepResult,
+        PendingIntent,
+        PendingIntentPayload,
+    )
+    from workout_program import (
+        PROGRAM_COMPLETED,
+        PROGRAM_FAILED,
+        PROGRAM_GOAL_REACHED,
+        PROGRAM_RUNNING,
+        PROGRAM_STOPPED,
+        ProgramProgress,
+        WorkoutProgram,
+    )
+
+
+LOW_MEMORY_MODE = os.environ.get("MIWALKINGPAD_LOW_MEMORY", "").strip().lower() in ("1", "true", "yes", "on")
+try:
+    RSS_BUDGET_MB = float(os.environ.get("MIWALKINGPAD_RSS_BUDGET_MB", "") or 0) or None
+except ValueError:
+    RSS_BUDGET_MB = None
 
 
 class WalkingPadBackend(BackendBase):
     RETRY_SECONDS = 5.0
     POLL_SECONDS = 5.0
+    PROBE_TIMEOUT_SECONDS = 1.0
+    SNAPSHOT_FILE = "status.json"
+    COMMAND_TIMEOUT_SECONDS = 20.0
+    BATCH_MAX_WAIT_SECONDS = 10.0
+    PROGRAM_CHECK_SECONDS = 5.0
+    PROGRAM_START_GRACE_SECONDS = 10.0
+    PROGRAM_DISCONNECT_GRACE_SECONDS = 60.0
+    SPEED_TOLERANCE = 0.05
+    PENDING_TIMEOUT_SECONDS = 8.0
+    ROLLBACK_VISIBLE_SECONDS = 30.0
+    STATUS_TEXT_LIMIT = 200
+    MEMORY_CHECK_SECONDS = 60.0
+    EVENT_LOG_CAPACITY = 200
+    LOW_MEMORY_EVENT_LOG_CAPACITY = 32
+    BATCH_OPERATIONS = (
+        "start_belt",
+        "stop_belt",
+        "toggle_belt",
+        "increase_speed",
+        "decrease_speed",
+        "set_speed",
+        "refresh_status",
+        "wait",
+    )
     MIN_SPEED = 0.0
     MAX_SPEED = 6.0
     MODEL = "ksmb.walkingpad.v1"
@@ -37,27 +127,106 @@ class WalkingPadBackend(BackendBase):
         self._stop_event = threading.Event()
         self._main_exit_event = threading.Event()
 
+        # Connection-loss paths repeat for as long as the device is away;
+        # route them through the rate-limited event log.
+        self._events = EventLog(log, capacity=self.EVENT_LOG_CAPACITY)
+
         self._config_lock = threading.Lock()
         self._ip = ""
         self._token = ""
         self._device_id = ""
 
         self._status_cache = BackendStatusCache()
+        self._reconnect = ReconnectPolicy()
+        self._program = ProgramProgress()
+        self._last_resolved_ip = ""
+        self._config_changed = asyncio.Event()
+
+        self._snapshot_store: StatusSnapshotStore | None = None
+        self._warm_connection: dict | None = None
+        self._load_warm_start()
+
+        self._status_channel: StatusChannelWriter | None = None
+        try:
+            self._status_channel = StatusChannelWriter()
+        except OSError as exc:
+            log.warning(f"WalkingPad status channel disabled: {exc}")
+        self._publish_status()
 
         self._loop = None
         self._loop_thread = None
         self._start_loop_thread()
 
+        self._profiler: SamplingProfiler | None = None
+        self._loop_monitor = LoopLagMonitor()
+        self._loop_monitor_task: concurrent.futures.Future | None = None
+        self._memory_task: concurrent.futures.Future | None = None
+        self._low_memory = False
+        self._rss_budget_bytes: int | None = None
+
         self._service: AsyncWalkingPadService | None = None
-        self._connection_task = asyncio.run_coroutine_threadsafe(self._connection_worker(), self._loop)
+        # Serialises device commands so a batch runs as one uninterrupted
+        # device session.
+        self._command_lock = asyncio.Lock()
+        self._program_task: concurrent.futures.Future | None = None
+        self._sessions = SessionPool(self._create_service)
+
+        self.set_low_memory_mode(LOW_MEMORY_MODE, RSS_BUDGET_MB)
+        # Started on first configure(); there is nothing to connect to before.
+        self._connection_task: concurrent.futures.Future | None = None
+
+    def _load_warm_start(self) -> None:
+        try:
+            self._snapshot_store = StatusSnapshotStore(os.path.join(plugin_data_dir(), self.SNAPSHOT_FILE))
+        except OSError as exc:
+            log.warning(f"WalkingPad status snapshot disabled: {exc}")
+            return
+
+        data = self._snapshot_store.load()
+        if data is None:
+            return
+
+        # Serve the last-known state right away; it is flagged stale until
+        # the first real poll (or failure) replaces it.
+        StatusSnapshotStore.apply(data, self._status_cache)
+        self._warm_connection = data.get("connection") or None
+
+    def _save_snapshot(self, force: bool = False) -> None:
+        if self._snapshot_store is None or self._status_cache.stale:
+            return
+        _ip, _token, device_id = self._read_config()
+        self._snapshot_store.save(self._status_cache, self._last_resolved_ip, device_id, force=force)
+
+    def _take_warm_ip(self, device_id: str) -> str:
+        warm, self._warm_connection = self._warm_connection, None
+        if not warm or not device_id:
+            return ""
+        if str(warm.get("device_id", "") or "").strip().lower() != device_id.strip().lower():
+            return ""
+        return str(warm.get("ip", "") or "").strip()
 
     def _start_loop_thread(self) -> None:
         self._loop = asyncio.new_event_loop()
         self._loop_thread = threading.Thread(target=self._run_loop, daemon=False, name="miwalkingpad-loop")
         self._loop_thread.start()
 
+    @staticmethod
+    async def _cancel_pending_tasks() -> None:
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
     def _stop_loop_thread(self) -> None:
         if self._loop is not None and self._loop.is_running():
+            # Cancelling the concurrent futures only schedules cancellation;
+            # let the loop process it so no task is destroyed while pending.
+            if threading.current_thread() is not self._loop_thread:
+                try:
+                    asyncio.run_coroutine_threadsafe(self._cancel_pending_tasks(), self._loop).result(timeout=2)
+                except Exception:
+                    pass
             self._loop.call_soon_threadsafe(self._loop.stop)
 
         if (
@@ -71,7 +240,7 @@ class WalkingPadBackend(BackendBase):
         asyncio.set_event_loop(self._loop)
         self._loop.run_forever()
 
-    def _run_coro(self, coro, timeout: float = 20.0):
+    def _run_coro(self, coro, timeout: float = COMMAND_TIMEOUT_SECONDS):
         fut = asyncio.run_coroutine_threadsafe(coro, self._loop)
         return fut.result(timeout=timeout)
 
@@ -79,6 +248,33 @@ class WalkingPadBackend(BackendBase):
         self._status_cache.connected = False
         self._status_cache.running = False
         self._status_cache.error = reason
+        self._status_cache.stale = False
+        self._status_cache.pending = None
+        self._publish_status()
+
+    def _publish_status(self) -> None:
+        # Called after every cache mutation so the plugin can read status
+        # from shared memory instead of calling get_status() over RPC.
+        if self._status_channel is None:
+            return
+        try:
+            self._status_channel.publish(self._channel_status())
+        except (OSError, ValueError) as exc:
+            self._events.event(
+                "WARNING", "status_channel_publish_failed", f"WalkingPad status channel publish failed: {exc}"
+            )
+
+    def _channel_status(self) -> BackendStatusPayload:
+        # The same exception text can show up in four fields; clip them so
+        # a verbose error cannot push the snapshot past the channel size.
+        limit = self.STATUS_TEXT_LIMIT
+        status = self.get_status()
+        status["error"] = status["error"][:limit]
+        status["reconnect"]["last_error"] = status["reconnect"]["last_error"][:limit]
+        status["program"]["error"] = status["program"]["error"][:limit]
+        if status["rollback"] is not None:
+            status["rollback"] = status["rollback"] | {"reason": str(status["rollback"]["reason"])[:limit]}
+        return status
 
     def _update_cached_status_fields(self, status) -> None:
         # Primary extraction based on py-miwalkingpad PadStatus contract.
@@ -108,11 +304,18 @@ class WalkingPadBackend(BackendBase):
         with self._config_lock:
             return self._ip, self._token, self._device_id
 
+    @staticmethod
+    def _discover_handshake(timeout: int, token: str | None):
+        with _startup.phase("import_discovery"):
+            from miwalkingpad.discovery import discover_handshake
+
+        return discover_handshake(timeout=timeout, token=token)
+
     def _resolve_ip_from_discovery(self, device_id: str) -> str | None:
         try:
-            found = discover_handshake(timeout=max(1, int(self.RETRY_SECONDS)), token=None)
+            found = self._discover_handshake(timeout=max(1, int(self.RETRY_SECONDS)), token=None)
         except Exception as exc:  # noqa: BLE001
-            log.warning(f"WalkingPad discovery failed: {exc}")
+            self._events.event("WARNING", "discovery_failed", f"WalkingPad discovery failed: {exc}")
             return None
 
         wanted = (device_id or "").strip().lower()
@@ -126,69 +329,138 @@ class WalkingPadBackend(BackendBase):
                 return entry_ip
         return None
 
-    async def _connection_worker(self) -> None:
-        active_cfg: tuple[str, str] | None = None
+    async def _wait_or_config_change(self, delay: float) -> None:
+        try:
+            await asyncio.wait_for(self._config_changed.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+
+    @staticmethod
+    def _create_service(ip: str, token: str, model: str) -> AsyncWalkingPadService:
+        with _startup.phase("import_miwalkingpad"):
+            from miwalkingpad import AsyncWalkingPadService, WalkingPadAdapter
+
+            try:
+                from .service_compat import patch_async_service, patch_miio_crypto
+            except ImportError:
+                from service_compat import patch_async_service, patch_miio_crypto
+
+        # Idempotent; keeps key derivation and cipher setup off the
+        # per-packet path for every pooled session.
+        patch_miio_crypto()
+        adapter = WalkingPadAdapter(ip=ip, token=token, model=model)
+        service = AsyncWalkingPadService(adapter=adapter)
+        patch_async_service(service)
+        return service
+
+    async def _retry_later(self, reason: str) -> None:
+        self._service = None
+        self._set_disconnected(reason)
+        delay = self._reconnect.record_failure(reason)
+        await self._wait_or_config_change(delay)
 
+    def _on_config_changed(self) -> None:
+        # Runs on the loop thread; new credentials deserve a fresh attempt.
+        self._reconnect.reset()
+        self._last_resolved_ip = ""
+        self._config_changed.set()
+
+    async def _connection_worker(self) -> None:
         while not self._stop_event.is_set():
+            self._config_changed.clear()
             configured_ip, token, device_id = self._read_config()
 
             token_value = (token or "").strip()
             if not token_value:
                 self._service = None
                 self._set_disconnected("missing_config")
-                await asyncio.sleep(self.RETRY_SECONDS)
+                await self._wait_or_config_change(self.RETRY_SECONDS)
                 continue
 
+            if self._reconnect.is_open:
+                if configured_ip:
+                    # Skip handshakes until the device answers a plain miio
+                    # hello again.
+                    if not await probe_miio_alive(configured_ip, self.PROBE_TIMEOUT_SECONDS):
+                        await self._retry_later("device_unreachable")
+                        continue
+                else:
+                    # A discovered address may have changed (new DHCP lease)
+                    # while the device was away; rediscover, but only at the
+                    # backoff cadence.
+                    self._last_resolved_ip = ""
+                self._reconnect.half_open()
+
             resolved_ip = configured_ip
+            if not resolved_ip and device_id:
+                # Try the address persisted by the previous run before paying
+                # for a discovery broadcast.
+                resolved_ip = self._take_warm_ip(device_id)
+            if not resolved_ip and device_id and self._sessions.has_ip(self._last_resolved_ip):
+                # Reuse the discovered address while its session is hot; the
+                # pool drops it after repeated failures, which falls back to
+                # discovery.
+                resolved_ip = self._last_resolved_ip
             if not resolved_ip and device_id:
                 discovered_ip = self._resolve_ip_from_discovery(device_id)
                 if discovered_ip is None:
-                    self._service = None
-                    self._set_disconnected("device_not_found")
-                    await asyncio.sleep(self.RETRY_SECONDS)
+                    await self._retry_later("device_not_found")
                     continue
                 resolved_ip = discovered_ip
 
-            cfg = (resolved_ip, token_value)
-
             if not resolved_ip:
                 self._service = None
                 self._set_disconnected("missing_config")
-                await asyncio.sleep(self.RETRY_SECONDS)
+                await self._wait_or_config_change(self.RETRY_SECONDS)
                 continue
 
-            if active_cfg != cfg or self._service is None:
-                try:
-                    adapter = WalkingPadAdapter(ip=resolved_ip, token=token_value, model=self.MODEL)
-                    service = AsyncWalkingPadService(adapter=adapter)
-                    patch_async_service(service)
-                    status = await self._get_status_safe(service)
-                    self._service = service
-                    active_cfg = cfg
-                    self._status_cache.connected = True
-                    self._status_cache.error = ""
-                    self._update_cached_status_fields(status)
-                    log.info("WalkingPad backend connected")
-                except Exception as exc:  # noqa: BLE001
-                    self._service = None
-                    self._set_disconnected(str(exc))
-                    log.warning(f"WalkingPad connect failed: {exc}")
-                    await asyncio.sleep(self.RETRY_SECONDS)
-                    continue
+            self._last_resolved_ip = resolved_ip
 
             try:
-                status = await self._get_status_safe(self._service)
-                self._status_cache.connected = True
-                self._status_cache.error = ""
-                self._update_cached_status_fields(status)
+                session = self._sessions.acquire((resolved_ip, token_value, self.MODEL))
             except Exception as exc:  # noqa: BLE001
-                self._set_disconnected(str(exc))
-                self._service = None
-                log.warning(f"WalkingPad connection lost: {exc}")
-                await asyncio.sleep(self.RETRY_SECONDS)
+                self._events.event("WARNING", "connect_failed", f"WalkingPad connect failed: {exc}")
+                await self._retry_later(str(exc))
                 continue
 
-            await asyncio.sleep(self.POLL_SECONDS)
+            # A hot session only costs one status request to (re)verify.
+            if not await self._poll_session(session):
+                continue
+
+            await self._wait_or_config_change(self.POLL_SECONDS)
+
+    async def _poll_session(self, session: WalkingPadSession) -> bool:
+        was_verified = session.verified
+        try:
+            status = await self._get_status_safe(session.service)
+        except Exception as exc:  # noqa: BLE001
+            dropped = self._sessions.mark_failed(session)
+            if was_verified:
+                self._events.event("WARNING", "connection_lost", f"WalkingPad connection lost: {exc}")
+            else:
+                self._events.event("WARNING", "connect_failed", f"WalkingPad connect failed: {exc}")
+            if dropped:
+                self._events.event(
+                    "INFO", "session_dropped", "WalkingPad session dropped, next attempt rebuilds it"
+                )
+            await self._retry_later(str(exc))
+            return False
+
+        self._sessions.mark_ok(session)
+        self._service = session.service
+        self._status_cache.connected = True
+        self._status_cache.error = ""
+        self._status_cache.stale = False
+        self._update_cached_status_fields(status)
+        self._reconcile_intent()
+        self._reconnect.record_success()
+        self._publish_status()
+        self._save_snapshot()
+        if not was_verified:
+            # Report how many failures were swallowed during the outage.
+            self._events.flush()
+            self._events.event("INFO", "connected", "WalkingPad backend connected")
+        return True
 
     def _request_stop(self) -> None:
         if self._stop_event.is_set():
@@ -196,6 +468,16 @@ class WalkingPadBackend(BackendBase):
 
         self._stop_event.set()
 
+        self._cancel_program()
+        if self._profiler is not None:
+            self._profiler.stop()
+
+        self._loop_monitor.stop()
+        if self._loop_monitor_task is not None:
+            self._loop_monitor_task.cancel()
+        if self._memory_task is not None:
+            self._memory_task.cancel()
+
         if self._connection_task is not None:
             self._connection_task.cancel()
 
@@ -209,7 +491,15 @@ class WalkingPadBackend(BackendBase):
                 pass
 
         self._stop_loop_thread()
-
+        self._save_snapshot(force=True)
+        if self._status_channel is not None:
+            # Leave readers with an offline state rather than the last poll.
+            self._set_disconnected("backend_stopped")
+            self._status_channel.close()
+            self._status_channel = None
+
+        self._events.flush(force=True)
+        log.complete()
         self._main_exit_event.set()
 
     def on_disconnect(self, conn) -> None:
@@ -232,15 +522,123 @@ class WalkingPadBackend(BackendBase):
     def _clamp(speed: float, min_value: float, max_value: float) -> float:
         return max(min_value, min(max_value, speed))
 
+    def _ensure_connection_task(self) -> None:
+        if self._connection_task is None and not self._stop_event.is_set():
+            self._connection_task = asyncio.run_coroutine_threadsafe(self._connection_worker(), self._loop)
+
+    def get_status_channel_path(self) -> str | None:
+        if self._status_channel is None:
+            return None
+        return self._status_channel.path
+
+    def get_loop_stats(self, reset: bool = False) -> dict:
+        """Scheduling-lag histogram of the loop thread plus captured stall stacks."""
+        return self._loop_monitor.snapshot(reset=bool(reset)) | {"enabled": self._loop_monitor_task is not None}
+
+    async def _memory_budget_worker(self) -> None:
+        while True:
+            await asyncio.sleep(self.MEMORY_CHECK_SECONDS)
+            budget = self._rss_budget_bytes
+            before = rss_bytes()
+            if budget is None or before is None or before <= budget:
+                continue
+
+            after = trim_memory()
+            self._events.event(
+                "WARNING",
+                "rss_over_budget",
+                f"WalkingPad backend RSS {before // 1024} KiB over budget {budget // 1024} KiB, trimmed to "
+                f"{(after or 0) // 1024} KiB",
+                rss_before=before,
+                rss_after=after,
+            )
+
+    def set_low_memory_mode(self, enabled: bool, rss_budget_mb: float | None = None) -> dict:
+        """Trade diagnostics and caches for a smaller idle footprint.
+
+        Low-memory mode keeps a single pooled session, shrinks the event
+        buffer and turns off the loop lag monitor (heartbeat task and
+        watchdog thread). A positive ``rss_budget_mb`` enables a periodic
+        check that collects garbage and trims the heap when RSS exceeds it.
+        """
+        self._low_memory = bool(enabled)
+        self._rss_budget_bytes = int(float(rss_budget_mb) * 1024 * 1024) if rss_budget_mb else None
+
+        self._sessions.resize(1 if self._low_memory else SessionPool.DEFAULT_MAX_SESSIONS)
+        self._events.resize(self.LOW_MEMORY_EVENT_LOG_CAPACITY if self._low_memory else self.EVENT_LOG_CAPACITY)
+
+        if self._low_memory and self._loop_monitor_task is not None:
+            self._loop_monitor.stop()
+            self._loop_monitor_task.cancel()
+            self._loop_monitor_task = None
+        elif not self._low_memory and self._loop_monitor_task is None:
+            self._loop_monitor_task = asyncio.run_coroutine_threadsafe(self._loop_monitor.run(), self._loop)
+
+        if self._rss_budget_bytes is not None and self._memory_task is None:
+            self._memory_task = asyncio.run_coroutine_threadsafe(self._memory_budget_worker(), self._loop)
+        elif self._rss_budget_bytes is None and self._memory_task is not None:
+            self._memory_task.cancel()
+            self._memory_task = None
+
+        if self._low_memory:
+            trim_memory()
+        return self.get_footprint_report(include_objects=False)
+
+    def get_footprint_report(self, include_objects: bool = True) -> dict:
+        """RSS, thread, module and (optionally) per-type object counts of this process."""
+        return footprint_report(include_objects=bool(include_objects)) | {
+            "low_memory": self._low_memory,
+            "rss_budget_bytes": self._rss_budget_bytes,
+            "import_ms": {
+                name: ms for name, ms in _startup.report()["phases_ms"].items() if name.startswith("import_")
+            },
+            "sessions": len(self._sessions),
+        }
+
+    def start_profiler(self, seconds: float = 10.0, interval_ms: float = 5.0) -> dict:
+        """Sample all backend threads for ``seconds`` and write collapsed stacks to the data dir."""
+        if self._profiler is None:
+            try:
+                self._profiler = SamplingProfiler(plugin_data_dir())
+            except OSError as exc:
+                return {"ok": False, "error": str(exc)}
+        return self._profiler.start(seconds=seconds, interval_ms=interval_ms)
+
+    def stop_profiler(self) -> dict:
+        if self._profiler is None:
+            return {"ok": False, "error": "profiler_not_started"}
+        return {"ok": True} | self._profiler.stop()
+
+    def get_profiler_status(self) -> dict:
+        if self._profiler is None:
+            return {"running": False, "last_result": None}
+        return self._profiler.status()
+
+    def get_recent_events(self, limit: int = 50) -> list[dict]:
+        """Most recent structured backend events, oldest first."""
+        return self._events.recent(limit)
+
+    def get_startup_report(self) -> dict:
+        return _startup.report()
+
     def configure(self, ip: str, token: str, device_id: str = "") -> dict:
+        new_config = ((ip or "").strip(), (token or "").strip(), (device_id or "").strip())
         with self._config_lock:
-            self._ip = (ip or "").strip()
-            self._token = (token or "").strip()
-            self._device_id = (device_id or "").strip()
-
-        # Force reconnect on updated credentials.
+            self._ensure_connection_task()
+            if new_config == (self._ip, self._token, self._device_id):
+                return self.get_status()
+            initial_config = not any((self._ip, self._token, self._device_id))
+            self._ip, self._token, self._device_id = new_config
+
+        # Force reconnect on updated credentials. Sessions stay pooled by
+        # (ip, token, model), so switching back to a known device is cheap.
+        # The initial push after startup keeps the warm-start snapshot.
         self._service = None
-        self._status_cache.connected = False
+        if not initial_config:
+            self._status_cache.connected = False
+            self._status_cache.stale = False
+            self._publish_status()
+        self._loop.call_soon_threadsafe(self._on_config_changed)
         return self.get_status()
 
     def discover_devices(self, token: str, timeout: int = 5) -> dict:
@@ -249,7 +647,7 @@ class WalkingPadBackend(BackendBase):
             return {"ok": False, "error": "token_required", "devices": []}
 
         try:
-            found = discover_handshake(timeout=max(1, int(timeout)), token=token_value)
+            found = self._discover_handshake(timeout=max(1, int(timeout)), token=token_value)
         except Exception as exc:  # noqa: BLE001
             return {"ok": False, "error": str(exc), "devices": []}
 
@@ -274,60 +672,425 @@ class WalkingPadBackend(BackendBase):
 
         return {"ok": True, "devices": devices}
 
+    def _begin_intent(self, command: str, running: bool, speed: float | None) -> PendingIntent:
+        # Reflect the requested state right away; the next poll confirms it
+        # (or rolls it back) in _reconcile_intent().
+        cache = self._status_cache
+        intent = PendingIntent(
+            command=command,
+            running=running,
+            speed=speed,
+            previous_running=cache.running,
+            previous_speed=cache.speed,
+            created_at=monotonic(),
+        )
+        cache.pending = intent
+        cache.running = running
+        if speed is not None:
+            cache.speed = speed
+        self._publish_status()
+        return intent
+
+    def _rollback_intent(self, intent: PendingIntent, reason: str) -> None:
+        cache = self._status_cache
+        if cache.pending is intent:
+            cache.pending = None
+            cache.running = intent.previous_running
+            cache.speed = intent.previous_speed
+        cache.rollback = {"command": intent.command, "reason": reason, "at": time()}
+        self._publish_status()
+
+    def _reconcile_intent(self) -> None:
+        """Compare a pending intent with freshly polled device values."""
+        cache = self._status_cache
+        if cache.rollback is not None and time() - cache.rollback["at"] > self.ROLLBACK_VISIBLE_SECONDS:
+            # Only report rollbacks the user may still be looking at.
+            cache.rollback = None
+
+        intent = cache.pending
+        if intent is None:
+            return
+
+        speed_matches = (
+            intent.speed is None
+            or (cache.speed is not None and abs(cache.speed - intent.speed) < self.SPEED_TOLERANCE)
+        )
+        if cache.running == intent.running and speed_matches:
+            cache.pending = None
+            # A confirmed command supersedes any earlier rollback.
+            cache.rollback = None
+            return
+
+        if not intent.acked or monotonic() - intent.created_at < self.PENDING_TIMEOUT_SECONDS:
+            # The belt takes a moment to spin up or change speed; keep
+            # showing the requested state until it catches up.
+            cache.running = intent.running
+            if intent.speed is not None:
+                cache.speed = intent.speed
+            return
+
+        # Device never reached the requested state: keep the polled values.
+        cache.pending = None
+        cache.rollback = {"command": intent.command, "reason": "not_confirmed", "at": time()}
+
+    async def _run_intent(self, intent: PendingIntent, device_call) -> None:
+        try:
+            await device_call
+        except BaseException as exc:
+            self._rollback_intent(intent, str(exc) or type(exc).__name__)
+            raise
+        intent.acked = True
+
     async def _start_belt_async(self) -> dict:
         await self._require_connected()
-        await self._service.start()
-        self._status_cache.running = True
+        intent = self._begin_intent("start_belt", running=True, speed=None)
+        await self._run_intent(intent, self._service.start())
         return self.get_status() | {"ok": True}
 
     async def _stop_belt_async(self) -> dict:
         await self._require_connected()
-        await self._service.stop()
-        self._status_cache.running = False
+        intent = self._begin_intent("stop_belt", running=False, speed=None)
+        await self._run_intent(intent, self._service.stop())
+        return self.get_status() | {"ok": True}
+
+    async def _toggle_belt_async(self) -> dict:
+        if self._status_cache.running:
+            return await self._stop_belt_async()
+        return await self._start_belt_async()
+
+    async def _set_speed_async(self, speed: float) -> dict:
+        await self._require_connected()
+
+        # Do not alter device start-speed configuration when belt is stopped.
+        # Speed changes become a no-op in stopped state.
+        if not self._status_cache.running:
+            return self.get_status() | {"ok": True}
+
+        target_speed = self._clamp(float(speed), self.MIN_SPEED, self.MAX_SPEED)
+        intent = self._begin_intent("set_speed", running=target_speed > 0.0, speed=target_speed)
+        await self._run_intent(intent, self._service.set_speed(target_speed))
         return self.get_status() | {"ok": True}
 
     async def _speed_delta_async(self, delta: float) -> dict:
         await self._require_connected()
-        running_now = self._status_cache.running
 
         if self._status_cache.speed is None:
             raise RuntimeError("walkingpad_speed_unavailable")
 
-        current_speed = float(self._status_cache.speed)
+        return await self._set_speed_async(float(self._status_cache.speed) + delta)
 
-        # Do not alter device start-speed configuration when belt is stopped.
-        # Speed +/- actions become a no-op in stopped state.
-        if not running_now:
-            return self.get_status() | {"ok": True}
+    async def _refresh_status_async(self) -> dict:
+        await self._require_connected()
+        status = await self._get_status_safe(self._service)
+        self._update_cached_status_fields(status)
+        self._reconcile_intent()
+        return self.get_status() | {"ok": True}
+
+    async def _locked(self, coro) -> dict:
+        async with self._command_lock:
+            return await coro
+
+    async def _run_batch_step(self, operation: dict) -> None:
+        op = operation["op"]
+        if op == "start_belt":
+            await self._start_belt_async()
+        elif op == "stop_belt":
+            await self._stop_belt_async()
+        elif op == "toggle_belt":
+            await self._toggle_belt_async()
+        elif op == "increase_speed":
+            await self._speed_delta_async(abs(float(operation.get("step", 0.5))))
+        elif op == "decrease_speed":
+            await self._speed_delta_async(-abs(float(operation.get("step", 0.5))))
+        elif op == "set_speed":
+            await self._set_speed_async(float(operation["speed"]))
+        elif op == "refresh_status":
+            await self._refresh_status_async()
+        elif op == "wait":
+            await asyncio.sleep(self._clamp(float(operation.get("seconds", 0.0)), 0.0, self.BATCH_MAX_WAIT_SECONDS))
+
+    async def _run_batch_async(self, operations: list[dict]) -> dict:
+        steps: list[BatchStepResult] = []
+        ok = True
+        batch_start = perf_counter()
+
+        async with self._command_lock:
+            for operation in operations:
+                step_start = perf_counter()
+                step: BatchStepResult = {"op": operation["op"], "ok": True}
+                try:
+                    await self._run_batch_step(operation)
+                except Exception as exc:  # noqa: BLE001
+                    step["ok"] = False
+                    step["error"] = str(exc)
+                step["elapsed_ms"] = round((perf_counter() - step_start) * 1000.0, 1)
+                steps.append(step)
+                if not step["ok"]:
+                    # Later steps usually depend on earlier ones (start, then
+                    # set speed); stop at the first failure.
+                    ok = False
+                    break
+
+        result = self.get_status() | {
+            "ok": ok,
+            "batch_steps": steps,
+            "total_ms": round((perf_counter() - batch_start) * 1000.0, 1),
+        }
+        if not ok:
+            result["error"] = steps[-1].get("error", "")
+        return result
+
+    async def _program_set_speed(self, progress: ProgramProgress, speed: float) -> None:
+        target_speed = self._clamp(float(speed), self.MIN_SPEED, self.MAX_SPEED)
+        progress.target_speed = target_speed
+
+        async with self._command_lock:
+            # Only talk to the device when the belt is not already at the
+            # target. A stopped belt ignores speed changes (_set_speed_async
+            # no-ops), so that is not a change either.
+            current_speed = self._status_cache.speed
+            if current_speed is not None and abs(current_speed - target_speed) < self.SPEED_TOLERANCE:
+                return
+            if not self._status_cache.running:
+                return
+            await self._set_speed_async(target_speed)
+        progress.speed_changes += 1
+
+    def _program_goal_reached(self, program: WorkoutProgram, start_distance: float, start_steps: int) -> bool:
+        goal = program.goal
+        if goal.distance_km is not None and self._status_cache.distance_km - start_distance >= goal.distance_km:
+            return True
+        if goal.steps is not None and self._status_cache.steps - start_steps >= goal.steps:
+            return True
+        return False
+
+    async def _run_program_async(self, program: WorkoutProgram, progress: ProgramProgress) -> None:
+        # ``progress`` belongs to this run only; a replaced or cancelled run
+        # can therefore never overwrite the state of its successor.
+        loop = asyncio.get_running_loop()
 
-        target_speed = self._clamp(current_speed + delta, self.MIN_SPEED, self.MAX_SPEED)
-        await self._service.set_speed(target_speed)
+        try:
+            async with self._command_lock:
+                await self._refresh_status_async()
+                if not self._status_cache.running:
+                    await self._start_belt_async()
+
+            started = loop.time()
+            start_distance = self._status_cache.distance_km
+            start_steps = self._status_cache.steps
+            goal_deadline = started + program.goal.seconds if program.goal.seconds is not None else None
+            # Time segments are scheduled against absolute deadlines derived
+            # from the program start, so wakeup jitter never accumulates.
+            anchor = started
+            goal_reached = False
+            disconnected_since: float | None = None
+
+            for index, segment in enumerate(program.segments):
+                progress.segment_index = index
+                await self._program_set_speed(progress, segment.speed)
+
+                segment_start_distance = self._status_cache.distance_km
+                if segment.seconds is not None:
+                    anchor += segment.seconds
+                    progress.segment_ends_at = anchor
+                else:
+                    progress.segment_ends_at = None
+                self._publish_status()
+
+                while True:
+                    now = loop.time()
+                    if self._program_goal_reached(program, start_distance, start_steps) or (
+                        goal_deadline is not None and now >= goal_deadline
+                    ):
+                        goal_reached = True
+                        break
+
+                    if not self._status_cache.connected:
+                        # A failed poll marks the cache disconnected and not
+                        # running, but the belt most likely keeps going; hold
+                        # the program until the link is back, for a while.
+                        if disconnected_since is None:
+                            disconnected_since = now
+                        elif now - disconnected_since > self.PROGRAM_DISCONNECT_GRACE_SECONDS:
+                            progress.finish(PROGRAM_FAILED, "device_unreachable")
+                            return
+                    else:
+                        disconnected_since = None
+                        if not self._status_cache.running and now - started > self.PROGRAM_START_GRACE_SECONDS:
+                            # Belt stopped outside the program (key press, remote).
+                            progress.finish(PROGRAM_STOPPED, "belt_stopped")
+                            return
+
+                    if self._status_cache.connected and self._status_cache.pending is None:
+                        # The last poll confirmed (or rolled back) the previous
+                        # command; resend the target if the belt drifted off it.
+                        await self._program_set_speed(progress, segment.speed)
+
+                    wake_at = now + self.PROGRAM_CHECK_SECONDS
+                    refresh = False
+                    if segment.seconds is not None:
+                        if now >= anchor:
+                            break
+                        wake_at = min(wake_at, anchor)
+                    else:
+                        remaining_km = segment.distance_km - (self._status_cache.distance_km - segment_start_distance)
+                        progress.segment_remaining_km = max(0.0, remaining_km)
+                        if remaining_km <= 0:
+                            break
+                        speed = self._status_cache.speed or 0.0
+                        if speed > 0.01:
+                            eta_at = now + remaining_km / speed * 3600.0
+                            if eta_at < wake_at:
+                                # Read the device only when the segment should be done.
+                                wake_at = eta_at
+                                refresh = True
+                    if goal_deadline is not None:
+                        wake_at = min(wake_at, goal_deadline)
+
+                    await asyncio.sleep(max(0.0, wake_at - loop.time()))
+                    if refresh and self._status_cache.connected:
+                        try:
+                            async with self._command_lock:
+                                await self._refresh_status_async()
+                        except Exception as exc:  # noqa: BLE001
+                            # The connection worker owns recovery; the program
+                            # just waits for its next poll.
+                            self._events.event(
+                                "WARNING", "program_refresh_failed", f"WalkingPad program refresh failed: {exc}"
+                            )
+
+                if segment.seconds is None:
+                    anchor = loop.time()
+                progress.segment_remaining_km = None
+                if goal_reached:
+                    break
+
+            if goal_reached or program.stop_at_end:
+                async with self._command_lock:
+                    await self._stop_belt_async()
+            progress.finish(PROGRAM_GOAL_REACHED if goal_reached else PROGRAM_COMPLETED)
+        except asyncio.CancelledError:
+            progress.finish(PROGRAM_STOPPED)
+            raise
+        except Exception as exc:  # noqa: BLE001
+            progress.finish(PROGRAM_FAILED, str(exc))
+            self._events.event("WARNING", "program_failed", f"WalkingPad program failed: {exc}")
+        finally:
+            self._publish_status()
+
+    def _cancel_program(self) -> None:
+        task = self._program_task
+        self._program_task = None
+        if task is None or task.done():
+            return
+        task.cancel()
+        if self._program.state == PROGRAM_RUNNING:
+            self._program.finish(PROGRAM_STOPPED)
+
+    def start_program(self, profile: dict) -> dict:
+        """Run an uploaded speed profile on the backend loop.
+
+        Segments are ``{"speed": km/h, "seconds": n}`` or
+        ``{"speed": km/h, "distance_km": n}``; an optional ``goal`` with
+        ``seconds``/``distance_km``/``steps`` stops the belt once reached.
+        Progress is reported under ``program`` in the status payload.
+        """
+        try:
+            program = WorkoutProgram.from_dict(profile)
+        except ValueError as exc:
+            return self.get_status() | {"ok": False, "error": str(exc)}
+
+        if self._service is None or not self._status_cache.connected:
+            return self.get_status() | {"ok": False, "error": "walkingpad_not_connected"}
+
+        self._cancel_program()
+        progress = ProgramProgress()
+        progress.begin(program)
+        self._program = progress
+        self._program_task = asyncio.run_coroutine_threadsafe(self._run_program_async(program, progress), self._loop)
+        self._publish_status()
+        return self.get_status() | {"ok": True}
 
-        self._status_cache.speed = target_speed
-        if target_speed <= 0.0:
-            self._status_cache.running = False
+    def stop_program(self, stop_belt: bool = False) -> dict:
+        was_running = self._program.state == PROGRAM_RUNNING
+        self._cancel_program()
+        if stop_belt:
+            return self.stop_belt()
+        self._publish_status()
+        if not was_running:
+            return self.get_status() | {"ok": False, "error": "program_not_running"}
         return self.get_status() | {"ok": True}
 
-    def _run_command(self, coro) -> dict:
+    def _run_command(self, coro, timeout: float | None = None) -> dict:
         try:
-            return self._run_coro(coro)
+            return self._run_coro(coro, timeout=timeout or self.COMMAND_TIMEOUT_SECONDS)
         except Exception as exc:  # noqa: BLE001
             # Command failures (for example user-ack timeouts) should not
             # force the backend into disconnected state. Connection health is
             # tracked by the polling loop.
             return self.get_status() | {"ok": False, "error": str(exc)}
+        finally:
+            self._publish_status()
 
     def start_belt(self) -> dict:
-        return self._run_command(self._start_belt_async())
+        return self._run_command(self._locked(self._start_belt_async()))
 
     def stop_belt(self) -> dict:
-        return self._run_command(self._stop_belt_async())
+        return self._run_command(self._locked(self._stop_belt_async()))
 
     def increase_speed(self, step: float = 0.5) -> dict:
-        return self._run_command(self._speed_delta_async(abs(float(step))))
+        return self._run_command(self._locked(self._speed_delta_async(abs(float(step)))))
 
     def decrease_speed(self, step: float = 0.5) -> dict:
-        return self._run_command(self._speed_delta_async(-abs(float(step))))
+        return self._run_command(self._locked(self._speed_delta_async(-abs(float(step)))))
+
+    def run_batch(self, operations: str | list[dict]) -> dict:
+        """Run ordered operations in one device-lock session and one RPC.
+
+        ``operations`` is a JSON array of dicts, each with an ``op`` key (see
+        BATCH_OPERATIONS) plus its arguments, e.g.
+        ``'[{"op": "set_speed", "speed": 3.0}]'``. RPC callers must pass the
+        JSON string: rpyc sends lists and dicts by reference, and walking
+        them would cost extra round trips per operation. In-process callers
+        may pass the decoded list.
+        """
+        normalized: list[dict] = []
+        wait_budget = 0.0
+        try:
+            if isinstance(operations, str):
+                operations = json.loads(operations)
+            if not isinstance(operations, (list, tuple, type(None))):
+                raise TypeError("operations_must_be_array")
+            for operation in operations or []:
+                operation = dict(operation)
+                op = str(operation.get("op", ""))
+                if op not in self.BATCH_OPERATIONS:
+                    return self.get_status() | {"ok": False, "error": f"unknown_batch_op:{op}", "batch_steps": []}
+                if op == "set_speed" and "speed" not in operation:
+                    return self.get_status() | {"ok": False, "error": "set_speed_requires_speed", "batch_steps": []}
+                if op == "wait":
+                    wait_budget += self._clamp(float(operation.get("seconds", 0.0)), 0.0, self.BATCH_MAX_WAIT_SECONDS)
+                operation["op"] = op
+                normalized.append(operation)
+        except (TypeError, ValueError) as exc:
+            # Malformed input (non-dict operation, non-numeric seconds) must
+            # come back as a result, not as an exception through the RPC.
+            return self.get_status() | {"ok": False, "error": f"invalid_batch_op:{exc}", "batch_steps": []}
+
+        timeout = self.COMMAND_TIMEOUT_SECONDS * max(1, len(normalized)) + wait_budget
+        return self._run_command(self._run_batch_async(normalized), timeout=timeout)
+
+    def _pending_payload(self) -> PendingIntentPayload | None:
+        intent = self._status_cache.pending
+        if intent is None:
+            return None
+        return {
+            "command": intent.command,
+            "running": intent.running,
+            "speed": intent.speed,
+            "acked": intent.acked,
+            "age_seconds": round(monotonic() - intent.created_at, 1),
+        }
 
     def get_status(self) -> BackendStatusPayload:
         return {
@@ -339,10 +1102,25 @@ class WalkingPadBackend(BackendBase):
             "steps": int(self._status_cache.steps),
             "distance_km": round(float(self._status_cache.distance_km), 3),
             "error": self._status_cache.error,
+            "stale": self._status_cache.stale,
+            "pending": self._pending_payload(),
+            "rollback": self._status_cache.rollback,
+            "reconnect": self._reconnect.snapshot(),
+            "program": self._program.snapshot(),
         }
 
 
-backend = WalkingPadBackend()
+if LOW_MEMORY_MODE:
+    # Applies to every thread started from here on (RPC server, loop,
+    # watchdog). The default synchronous stderr sink is kept as well: the
+    # enqueued sink needs its own worker thread and a multiprocessing queue.
+    threading.stack_size(LOW_MEMORY_STACK_SIZE)
+else:
+    use_enqueued_sink(log)
+
+with _startup.phase("backend_init"):
+    backend = WalkingPadBackend()
+log.info(f"WalkingPad backend startup: {_startup.format()}")
 
 # Keep the main thread alive.
 # If the module exits immediately, Python starts interpreter shutdown,
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import os
+
+APP_DIR_NAME = "streamcontroller-miwalkingpad"
+
+
+def plugin_data_dir() -> str:
+    """Return (and create) the per-user directory for backend state files."""
+    base = os.environ.get("XDG_STATE_HOME") or os.path.join(os.path.expanduser("~"), ".local", "state")
+    path = os.path.join(base, APP_DIR_NAME)
+    os.makedirs(path, exist_ok=True)
+    return path
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from collections import deque
+from time import monotonic, time
+
+
+def use_enqueued_sink(logger) -> None:
+    """Replace loguru's default stderr sink with a non-blocking, enqueued one."""
+    logger.remove()
+    logger.add(sys.stderr, level=os.environ.get("LOGURU_LEVEL", "DEBUG"), enqueue=True)
+
+
+class EventLog:
+    """Structured backend events with per-key rate limiting.
+
+    Every event lands in an in-memory ring buffer (consecutive repeats of the
+    same key are coalesced into one entry). Only the first event per key in
+    each ``min_interval`` window reaches the logger; the rest are counted and
+    reported as a summary on the next emitted line or on ``flush()``.
+    """
+
+    def __init__(self, logger, capacity: int = 200, min_interval: float = 300.0) -> None:
+        self._logger = logger
+        self._min_interval = min_interval
+        self._lock = threading.Lock()
+        self._events: deque[dict] = deque(maxlen=capacity)
+        self._last_emit: dict[str, float] = {}
+        self._suppressed: dict[str, int] = {}
+        self._last_flush: float | None = None
+
+    def resize(self, capacity: int) -> None:
+        with self._lock:
+            self._events = deque(self._events, maxlen=max(1, int(capacity)))
+
+    def event(self, level: str, key: str, message: str, **fields) -> bool:
+        """Record an event; return True if it was written to the log."""
+        now = monotonic()
+        with self._lock:
+            last = self._events[-1] if self._events else None
+            if last is not None and last["key"] == key and last["message"] == message:
+                last["repeat"] += 1
+                last["last_at"] = time()
+            else:
+                self._events.append(
+                    {
+                        "at": time(),
+                        "last_at": time(),
+                        "level": level,
+                        "key": key,
+                        "message": message,
+                        "fields": fields,
+                        "repeat": 1,
+                    }
+                )
+
+            last_emit = self._last_emit.get(key)
+            if last_emit is not None and now - last_emit < self._min_interval:
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                return False
+
+            self._last_emit[key] = now
+            suppressed = self._suppressed.pop(key, 0)
+
+        if suppressed:
+            message = f"{message} (suppressed {suppressed} similar)"
+        self._logger.log(level, message)
+        return True
+
+    def flush(self, *keys: str, force: bool = False) -> None:
+        """Log pending suppressed counts for ``keys`` (all if empty) as one line.
+
+        Rate-limit windows stay in place, and the summary itself is written
+        at most once per ``min_interval`` unless ``force`` is set: a
+        flapping condition that flushes on every cycle keeps accumulating
+        counts instead of logging at full rate.
+        """
+        now = monotonic()
+        with self._lock:
+            selected = keys or tuple(self._suppressed)
+            pending = {key: self._suppressed[key] for key in selected if self._suppressed.get(key)}
+            if not pending:
+                return
+            if not force and self._last_flush is not None and now - self._last_flush < self._min_interval:
+                return
+            self._last_flush = now
+            for key in pending:
+                del self._suppressed[key]
+
+        summary = ", ".join(f"{key} x{count}" for key, count in pending.items())
+        self._logger.info(f"Suppressed similar events: {summary}")
+
+    def recent(self, limit: int = 50) -> list[dict]:
+        with self._lock:
+            events = list(self._events)
+        limit = max(0, int(limit))
+        return [dict(entry) for entry in events[-limit:]] if limit else []
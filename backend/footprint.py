@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import gc
+import sys
+import threading
+from collections import Counter
+
+LOW_MEMORY_STACK_SIZE = 256 * 1024
+
+
+def _proc_status_kb(field: str) -> int | None:
+    try:
+        with open("/proc/self/status", encoding="ascii") as fh:
+            for line in fh:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return None
+
+
+def rss_bytes() -> int | None:
+    kb = _proc_status_kb("VmRSS")
+    return kb * 1024 if kb is not None else None
+
+
+def peak_rss_bytes() -> int | None:
+    kb = _proc_status_kb("VmHWM")
+    if kb is not None:
+        return kb * 1024
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is KiB on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def trim_memory() -> int | None:
+    """Run a full GC and hand freed heap pages back to the OS; return RSS afterwards."""
+    gc.collect()
+    import ctypes
+
+    try:
+        # glibc only; other libcs simply keep their pages.
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+    return rss_bytes()
+
+
+def footprint_report(top: int = 15, include_objects: bool = True) -> dict:
+    packages: Counter[str] = Counter(name.partition(".")[0] for name in list(sys.modules))
+    report = {
+        "rss_bytes": rss_bytes(),
+        "peak_rss_bytes": peak_rss_bytes(),
+        "threads": sorted(thread.name for thread in threading.enumerate()),
+        "thread_stack_size": threading.stack_size() or None,
+        "modules_loaded": sum(packages.values()),
+        "modules_by_package": dict(packages.most_common(top)),
+        "gc_counts": list(gc.get_count()),
+    }
+
+    if include_objects:
+        # Walks every tracked object; only done on demand.
+        types = Counter(type(obj).__name__ for obj in gc.get_objects())
+        report["objects_tracked"] = sum(types.values())
+        report["objects_by_type"] = dict(types.most_common(top))
+    return report
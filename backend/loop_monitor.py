@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import traceback
+from bisect import bisect_left
+from collections import deque
+from time import monotonic, time
+
+
+class LoopLagMonitor:
+    """Measures event-loop scheduling delay and captures stacks of stalls.
+
+    A heartbeat task sleeps for ``interval`` on the loop and records how late
+    it wakes up. A watchdog thread notices when the heartbeat is overdue by
+    more than ``stall_threshold`` and snapshots the loop thread's stack while
+    the offending callback is still running.
+    """
+
+    BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+    def __init__(
+        self,
+        interval: float = 0.2,
+        stall_threshold: float = 0.25,
+        max_stalls: int = 20,
+    ) -> None:
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self._samples = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._stalls: deque[dict] = deque(maxlen=max_stalls)
+
+        self._heartbeat = monotonic()
+        self._stall_captured = False
+        self._loop_thread_id: int | None = None
+        self._stop_event = threading.Event()
+        self._watchdog: threading.Thread | None = None
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        # Each run gets its own stop event: a watchdog left over from a
+        # previous run may still be winding down, and must neither keep
+        # this run's watchdog from starting nor be revived by it.
+        stop_event = threading.Event()
+        self._stop_event = stop_event
+        self._heartbeat = monotonic()
+        self._start_watchdog(stop_event)
+
+        try:
+            while True:
+                self._heartbeat = monotonic()
+                self._stall_captured = False
+                expected = loop.time() + self.interval
+                await asyncio.sleep(self.interval)
+                self._record(max(0.0, loop.time() - expected) * 1000.0)
+        finally:
+            stop_event.set()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def _record(self, lag_ms: float) -> None:
+        with self._lock:
+            self._counts[bisect_left(self.BUCKETS_MS, lag_ms)] += 1
+            self._samples += 1
+            self._total_ms += lag_ms
+            self._max_ms = max(self._max_ms, lag_ms)
+
+    def _start_watchdog(self, stop_event: threading.Event) -> None:
+        self._watchdog = threading.Thread(
+            target=self._watch, args=(stop_event,), daemon=True, name="miwalkingpad-loop-watchdog"
+        )
+        self._watchdog.start()
+
+    def _watch(self, stop_event: threading.Event) -> None:
+        while not stop_event.wait(self.interval):
+            overdue = monotonic() - self._heartbeat - self.interval
+            if overdue < self.stall_threshold or self._stall_captured:
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+
+            self._stall_captured = True
+            stack = traceback.format_stack(frame)
+            del frame
+            with self._lock:
+                self._stalls.append(
+                    {
+                        "at": time(),
+                        "overdue_ms": round(overdue * 1000.0, 1),
+                        "stack": "".join(stack),
+                    }
+                )
+
+    def _percentile(self, fraction: float) -> float | None:
+        # Histogram-based: returns the upper bound of the matching bucket.
+        if self._samples == 0:
+            return None
+        rank = fraction * self._samples
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return float(self.BUCKETS_MS[index]) if index < len(self.BUCKETS_MS) else None
+        return None
+
+    def snapshot(self, reset: bool = False) -> dict:
+        with self._lock:
+            histogram = {f"<={bound}ms": count for bound, count in zip(self.BUCKETS_MS, self._counts)}
+            histogram[f">{self.BUCKETS_MS[-1]}ms"] = self._counts[-1]
+            result = {
+                "interval_ms": self.interval * 1000.0,
+                "stall_threshold_ms": self.stall_threshold * 1000.0,
+                "samples": self._samples,
+                "mean_ms": round(self._total_ms / self._samples, 2) if self._samples else None,
+                "max_ms": round(self._max_ms, 2),
+                "p50_ms": self._percentile(0.5),
+                "p99_ms": self._percentile(0.99),
+                "histogram": histogram,
+                "stalls": list(self._stalls),
+            }
+
+            if reset:
+                self._counts = [0] * len(self._counts)
+                self._samples = 0
+                self._total_ms = 0.0
+                self._max_ms = 0.0
+                self._stalls.clear()
+        return result
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from dataclasses import dataclass, field
+from time import monotonic
+
+try:
+    from .status_types import ReconnectStatePayload
+except ImportError:
+    # Allow direct script execution (no package context)
+    from status_types import ReconnectStatePayload
+
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+MIIO_PORT = 54321
+# miio "hello" packet: magic 0x2131, length 0x0020, rest all 0xff. Devices
+# answer it without authentication, which makes it a cheap liveness check.
+MIIO_HELLO_PACKET = bytes.fromhex("21310020" + "ff" * 28)
+
+
+@dataclass(slots=True)
+class ReconnectPolicy:
+    base_seconds: float = 1.0
+    max_seconds: float = 60.0
+    multiplier: float = 2.0
+    jitter: float = 0.2
+    failure_threshold: int = 5
+
+    state: str = CIRCUIT_CLOSED
+    attempts: int = 0
+    last_error: str = ""
+    retry_at: float | None = None
+    _rng: random.Random = field(default_factory=random.Random, repr=False)
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == CIRCUIT_OPEN
+
+    def reset(self) -> None:
+        self.state = CIRCUIT_CLOSED
+        self.attempts = 0
+        self.last_error = ""
+        self.retry_at = None
+
+    def record_success(self) -> None:
+        self.reset()
+
+    def record_failure(self, reason: str) -> float:
+        """Register a failed attempt and return the delay before the next one."""
+        self.attempts += 1
+        self.last_error = reason
+        if self.attempts >= self.failure_threshold:
+            self.state = CIRCUIT_OPEN
+
+        delay = self.next_delay()
+        self.retry_at = monotonic() + delay
+        return delay
+
+    def half_open(self) -> None:
+        if self.state == CIRCUIT_OPEN:
+            self.state = CIRCUIT_HALF_OPEN
+
+    def next_delay(self) -> float:
+        exponent = max(0, self.attempts - 1)
+        delay = min(self.max_seconds, self.base_seconds * (self.multiplier**exponent))
+        spread = delay * self.jitter
+        delay += self._rng.uniform(-spread, spread)
+        return max(self.base_seconds, min(self.max_seconds, delay))
+
+    def snapshot(self) -> ReconnectStatePayload:
+        retry_in = 0.0
+        if self.retry_at is not None:
+            retry_in = max(0.0, self.retry_at - monotonic())
+        return {
+            "state": self.state,
+            "attempts": self.attempts,
+            "retry_in_seconds": round(retry_in, 1),
+            "last_error": self.last_error,
+        }
+
+
+class _HelloProtocol(asyncio.DatagramProtocol):
+    def __init__(self, answered: asyncio.Future) -> None:
+        self._answered = answered
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        if not self._answered.done() and data[:2] == MIIO_HELLO_PACKET[:2]:
+            self._answered.set_result(True)
+
+    def error_received(self, exc: Exception) -> None:
+        if not self._answered.done():
+            self._answered.set_result(False)
+
+
+async def probe_miio_alive(ip: str, timeout: float = 1.0) -> bool:
+    """Send a single miio hello datagram and report whether the device answered."""
+    loop = asyncio.get_running_loop()
+    answered: asyncio.Future = loop.create_future()
+    try:
+        transport, _protocol = await loop.create_datagram_endpoint(
+            lambda: _HelloProtocol(answered),
+            remote_addr=(ip, MIIO_PORT),
+        )
+    except OSError:
+        return False
+
+    try:
+        transport.sendto(MIIO_HELLO_PACKET)
+        return await asyncio.wait_for(answered, timeout=timeout)
+    except (asyncio.TimeoutError, OSError):
+        return False
+    finally:
+        transport.close()
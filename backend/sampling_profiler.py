@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from collections import Counter
+from time import monotonic, strftime
+
+
+class SamplingProfiler:
+    """Timer-driven stack sampler writing collapsed stacks (flamegraph input).
+
+    Nothing runs while the profiler is idle; a sampling thread only exists
+    for the duration of a requested run.
+    """
+
+    MAX_SECONDS = 300.0
+    MIN_INTERVAL = 0.001
+
+    def __init__(self, output_dir: str) -> None:
+        self._output_dir = output_dir
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._last_result: dict | None = None
+        self._started_at = 0.0
+        self._duration = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, seconds: float, interval_ms: float = 5.0) -> dict:
+        with self._lock:
+            if self.running:
+                return {"ok": False, "error": "profiler_already_running"} | self.status()
+
+            self._duration = max(0.1, min(self.MAX_SECONDS, float(seconds)))
+            interval = max(self.MIN_INTERVAL, float(interval_ms) / 1000.0)
+            self._stop_event.clear()
+            self._started_at = monotonic()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(self._duration, interval),
+                daemon=True,
+                name="miwalkingpad-profiler",
+            )
+            self._thread.start()
+        return {"ok": True} | self.status()
+
+    def stop(self) -> dict:
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        return self.status()
+
+    def status(self) -> dict:
+        elapsed = monotonic() - self._started_at if self.running else 0.0
+        return {
+            "running": self.running,
+            "elapsed_seconds": round(elapsed, 1),
+            "duration_seconds": self._duration,
+            "last_result": self._last_result,
+        }
+
+    def _run(self, duration: float, interval: float) -> None:
+        own_id = threading.get_ident()
+        stacks: Counter[str] = Counter()
+        samples = 0
+        deadline = monotonic() + duration
+
+        while monotonic() < deadline and not self._stop_event.wait(interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                parts = []
+                while frame is not None:
+                    code = frame.f_code
+                    parts.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                    frame = frame.f_back
+                parts.append(names.get(thread_id, str(thread_id)))
+                stacks[";".join(reversed(parts))] += 1
+            samples += 1
+
+        self._last_result = self._write(stacks, samples, interval)
+
+    def _write(self, stacks: Counter[str], samples: int, interval: float) -> dict:
+        path = os.path.join(self._output_dir, f"profile-{strftime('%Y%m%d-%H%M%S')}.collapsed")
+        try:
+            with open(path, "w", encoding="utf-8") as fh:
+                for stack, count in stacks.most_common():
+                    fh.write(f"{stack} {count}\n")
+        except OSError as exc:
+            return {"ok": False, "error": str(exc), "samples": samples}
+
+        return {
+            "ok": True,
+            "path": path,
+            "samples": samples,
+            "interval_ms": round(interval * 1000.0, 3),
+            "unique_stacks": len(stacks),
+        }
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from functools import lru_cache
 from time import perf_counter
 from types import MethodType
 
@@ -54,3 +55,51 @@ def patch_async_service(service: AsyncWalkingPadService) -> None:
 
     service._run_blocking = MethodType(_run_blocking_no_thread, service)
 
+
+def patch_miio_crypto() -> bool:
+    """Cache per-token AES key/IV and cipher setup in python-miio.
+
+    Stock ``miio.protocol.Utils`` re-derives the MD5 key/IV from the token
+    and builds a new AES cipher for every packet. The token is fixed for a
+    session, so derive once and only create the per-packet encryptor.
+    Returns False when python-miio is not what the adapter talks through.
+    """
+    try:
+        from cryptography.hazmat.primitives import padding
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+        from miio.protocol import Utils
+    except ImportError:
+        return False
+
+    if getattr(Utils, "_miwalkingpad_crypto_cache", False):
+        return True
+
+    key_iv = lru_cache(maxsize=8)(Utils.key_iv)
+
+    @lru_cache(maxsize=8)
+    def _cipher(token: bytes) -> Cipher:
+        key, iv = key_iv(token)
+        return Cipher(algorithms.AES(key), modes.CBC(iv))
+
+    def encrypt(plaintext: bytes, token: bytes) -> bytes:
+        if not isinstance(plaintext, bytes):
+            raise TypeError("plaintext requires bytes")
+        Utils.verify_token(token)
+        padder = padding.PKCS7(128).padder()
+        encryptor = _cipher(token).encryptor()
+        return encryptor.update(padder.update(plaintext) + padder.finalize()) + encryptor.finalize()
+
+    def decrypt(ciphertext: bytes, token: bytes) -> bytes:
+        if not isinstance(ciphertext, bytes):
+            raise TypeError("ciphertext requires bytes")
+        Utils.verify_token(token)
+        decryptor = _cipher(token).decryptor()
+        padded_plaintext = decryptor.update(ciphertext) + decryptor.finalize()
+        unpadder = padding.PKCS7(128).unpadder()
+        return unpadder.update(padded_plaintext) + unpadder.finalize()
+
+    Utils.key_iv = staticmethod(key_iv)
+    Utils.encrypt = staticmethod(encrypt)
+    Utils.decrypt = staticmethod(decrypt)
+    Utils._miwalkingpad_crypto_cache = True
+    return True
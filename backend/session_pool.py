@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Callable
+
+SessionKey = tuple[str, str, str]
+
+
+@dataclass(slots=True)
+class WalkingPadSession:
+    key: SessionKey
+    service: Any
+    failures: int = 0
+    verified: bool = False
+    last_used: float = 0.0
+
+
+class SessionPool:
+    """Keeps miio services alive per ``(ip, token, model)`` across reconnects.
+
+    A session survives transient errors and is only rebuilt (new adapter,
+    new handshake) after ``max_failures`` consecutive failures.
+    """
+
+    DEFAULT_MAX_SESSIONS = 2
+
+    def __init__(
+        self,
+        factory: Callable[[str, str, str], Any],
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        max_failures: int = 3,
+    ) -> None:
+        self._factory = factory
+        self._max_sessions = max(1, int(max_sessions))
+        self._max_failures = max(1, int(max_failures))
+        self._sessions: OrderedDict[SessionKey, WalkingPadSession] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def resize(self, max_sessions: int) -> None:
+        self._max_sessions = max(1, int(max_sessions))
+        while len(self._sessions) > self._max_sessions:
+            self._sessions.popitem(last=False)
+
+    def has_ip(self, ip: str) -> bool:
+        return bool(ip) and any(key[0] == ip for key in self._sessions)
+
+    def acquire(self, key: SessionKey) -> WalkingPadSession:
+        session = self._sessions.get(key)
+        if session is None:
+            ip, token, model = key
+            session = WalkingPadSession(key=key, service=self._factory(ip, token, model))
+            self._sessions[key] = session
+            while len(self._sessions) > self._max_sessions:
+                self._sessions.popitem(last=False)
+        else:
+            self._sessions.move_to_end(key)
+
+        session.last_used = monotonic()
+        return session
+
+    def mark_ok(self, session: WalkingPadSession) -> None:
+        session.failures = 0
+        session.verified = True
+
+    def mark_failed(self, session: WalkingPadSession) -> bool:
+        """Record a failure; return True if the session was dropped."""
+        session.failures += 1
+        if session.failures >= self._max_failures:
+            self.evict(session.key)
+            return True
+        return False
+
+    def evict(self, key: SessionKey) -> None:
+        self._sessions.pop(key, None)
+
+    def clear(self) -> None:
+        self._sessions.clear()
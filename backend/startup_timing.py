@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Iterator
+
+
+class StartupTimer:
+    """Collects named wall-clock phases relative to a common origin."""
+
+    def __init__(self) -> None:
+        self._origin = perf_counter()
+        self._phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self._phases[name] = self._phases.get(name, 0.0) + (perf_counter() - start) * 1000.0
+
+    def elapsed_ms(self) -> float:
+        return (perf_counter() - self._origin) * 1000.0
+
+    def report(self) -> dict:
+        return {
+            "elapsed_ms": round(self.elapsed_ms(), 1),
+            "phases_ms": {name: round(ms, 1) for name, ms in self._phases.items()},
+        }
+
+    def format(self) -> str:
+        parts = ", ".join(f"{name}={ms:.1f}ms" for name, ms in self._phases.items())
+        return f"{parts} (elapsed {self.elapsed_ms():.1f}ms)"
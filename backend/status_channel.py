@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from time import monotonic
+
+# Fixed layout shared by the backend (writer) and the plugin (reader):
+#   offset 0:  u64 sequence number, odd while a write is in progress
+#   offset 8:  u32 length of the JSON body, OVERFLOW_LENGTH if the latest
+#              snapshot did not fit (readers must fall back to RPC)
+#   offset 12: u32 writer pid, 0 once the writer has closed the channel
+#   offset 16: JSON body, at most BODY_CAPACITY bytes
+# This module must only use the standard library: the plugin process imports
+# it without the backend venv.
+CHANNEL_SIZE = 4096
+HEADER = struct.Struct("<QII")
+BODY_OFFSET = 16
+BODY_CAPACITY = CHANNEL_SIZE - BODY_OFFSET
+OVERFLOW_LENGTH = 0xFFFFFFFF
+
+
+def default_channel_path() -> str:
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, f"miwalkingpad-status-{os.getpid()}.bin")
+
+
+class StatusChannelWriter:
+    """Publishes status snapshots into a memory-mapped file under a seqlock."""
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path or default_channel_path()
+        self._lock = threading.Lock()
+        self._last_body = b""
+        self._seq = 0
+        self._overflowed = False
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.ftruncate(fd, CHANNEL_SIZE)
+            self._mm = mmap.mmap(fd, CHANNEL_SIZE, access=mmap.ACCESS_WRITE)
+        finally:
+            os.close(fd)
+        self._pid = os.getpid()
+        HEADER.pack_into(self._mm, 0, self._seq, 0, self._pid)
+
+    def publish(self, payload: dict) -> bool:
+        """Publish ``payload``; return False if it equals the last snapshot.
+
+        Raises ValueError if the body does not fit. Readers are told to fall
+        back rather than keep serving the previous snapshot.
+        """
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+        with self._lock:
+            if len(body) > BODY_CAPACITY:
+                if not self._overflowed:
+                    self._seq += 2
+                    HEADER.pack_into(self._mm, 0, self._seq, OVERFLOW_LENGTH, self._pid)
+                    self._overflowed = True
+                    self._last_body = b""
+                raise ValueError(f"status_body_too_large:{len(body)}")
+            if body == self._last_body:
+                return False
+
+            mm = self._mm
+            # Odd sequence marks the body as being rewritten.
+            self._seq += 1
+            HEADER.pack_into(mm, 0, self._seq, 0, self._pid)
+            mm[BODY_OFFSET : BODY_OFFSET + len(body)] = body
+            self._seq += 1
+            HEADER.pack_into(mm, 0, self._seq, len(body), self._pid)
+            self._last_body = body
+            self._overflowed = False
+            return True
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                # Tell readers the channel is gone; their mapping outlives
+                # the unlink below.
+                HEADER.pack_into(self._mm, 0, self._seq, 0, 0)
+                self._mm.close()
+            except (BufferError, ValueError):
+                pass
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+
+class StatusChannelReader:
+    """Reads the latest snapshot without IPC; unchanged snapshots are served from cache.
+
+    ``read()`` returns None once the writer closed the channel or its process
+    is gone, or while the latest snapshot overflowed the channel, so callers
+    can fall back to RPC.
+    """
+
+    MAX_RETRIES = 8
+    LIVENESS_CHECK_SECONDS = 1.0
+
+    def __init__(self, path: str) -> None:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            self._mm = mmap.mmap(fd, CHANNEL_SIZE, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        self._seq_view = memoryview(self._mm)[:8].cast("Q")
+        self._length_view = memoryview(self._mm)[8:12].cast("I")
+        self._pid_view = memoryview(self._mm)[12:16].cast("I")
+        self._cached_seq = 0
+        self._cached: dict | None = None
+        self._checked_at = 0.0
+        self.alive = True
+
+    @property
+    def version(self) -> int:
+        """Sequence number of the snapshot last returned by read()."""
+        return self._cached_seq
+
+    @property
+    def available(self) -> bool:
+        """False once read() can no longer serve current snapshots."""
+        return self.alive and self._length_view[0] != OVERFLOW_LENGTH
+
+    def _writer_alive(self) -> bool:
+        pid = self._pid_view[0]
+        if pid == 0:
+            return False
+
+        now = monotonic()
+        if now - self._checked_at < self.LIVENESS_CHECK_SECONDS:
+            return True
+        self._checked_at = now
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    def read(self) -> dict | None:
+        if not self.alive:
+            return None
+        if not self._writer_alive():
+            self.alive = False
+            self._cached = None
+            return None
+
+        for _attempt in range(self.MAX_RETRIES):
+            seq = self._seq_view[0]
+            if seq == self._cached_seq:
+                return self._cached
+            if seq & 1:
+                continue
+
+            _seq, length, _pid = HEADER.unpack_from(self._mm, 0)
+            if length == OVERFLOW_LENGTH:
+                self._cached = None
+                self._cached_seq = seq
+                return None
+            body = self._mm[BODY_OFFSET : BODY_OFFSET + length]
+            if self._seq_view[0] != seq:
+                continue
+
+            try:
+                self._cached = json.loads(body)
+            except ValueError:
+                return self._cached
+            self._cached_seq = seq
+            return self._cached
+
+        return self._cached
+
+    def close(self) -> None:
+        self._seq_view.release()
+        self._length_view.release()
+        self._pid_view.release()
+        self._mm.close()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+import os
+from time import monotonic, time
+
+try:
+    from .status_types import BackendStatusCache
+except ImportError:
+    # Allow direct script execution (no package context)
+    from status_types import BackendStatusCache
+
+
+SNAPSHOT_FIELDS = ("connected", "running", "speed", "runtime_seconds", "steps", "distance_km")
+
+
+class StatusSnapshotStore:
+    """Persists the last-known status and resolved address between restarts.
+
+    Writes are atomic (temp file + rename) and throttled: a snapshot is only
+    written when connection/running state flips or ``min_interval`` passed
+    since the previous write.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, min_interval: float = 30.0) -> None:
+        self._path = path
+        self._min_interval = min_interval
+        self._last_written: dict | None = None
+        self._last_write_at = 0.0
+
+    def load(self) -> dict | None:
+        try:
+            with open(self._path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return None
+        self._last_written = data
+        return data
+
+    def save(self, cache: BackendStatusCache, ip: str, device_id: str, force: bool = False) -> bool:
+        status = {name: getattr(cache, name) for name in SNAPSHOT_FIELDS}
+        connection = {"ip": ip, "device_id": device_id}
+
+        previous = self._last_written
+        if previous is not None and previous.get("status") == status and previous.get("connection") == connection:
+            return False
+
+        flipped = previous is None or any(
+            previous.get("status", {}).get(name) != status[name] for name in ("connected", "running")
+        )
+        if not force and not flipped and monotonic() - self._last_write_at < self._min_interval:
+            return False
+
+        data = {"version": self.VERSION, "saved_at": time(), "status": status, "connection": connection}
+        tmp_path = f"{self._path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump(data, fh)
+            os.replace(tmp_path, self._path)
+        except OSError:
+            return False
+
+        self._last_written = data
+        self._last_write_at = monotonic()
+        return True
+
+    @staticmethod
+    def apply(data: dict, cache: BackendStatusCache) -> None:
+        status = data.get("status", {}) or {}
+        for name in SNAPSHOT_FIELDS:
+            if name in status:
+                setattr(cache, name, status[name])
+        cache.stale = True
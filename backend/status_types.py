@@ -4,6 +4,17 @@ from dataclasses import dataclass
 from typing import TypedDict
 
 
+@dataclass(slots=True)
+class PendingIntent:
+    command: str
+    running: bool
+    speed: float | None
+    previous_running: bool
+    previous_speed: float | None
+    created_at: float
+    acked: bool = False
+
+
 @dataclass(slots=True)
 class BackendStatusCache:
     connected: bool = False
@@ -13,6 +24,50 @@ class BackendStatusCache:
     steps: int = 0
     distance_km: float = 0.0
     error: str = ""
+    stale: bool = False
+    pending: PendingIntent | None = None
+    rollback: RollbackPayload | None = None
+
+
+class PendingIntentPayload(TypedDict):
+    command: str
+    running: bool
+    speed: float | None
+    acked: bool
+    age_seconds: float
+
+
+class RollbackPayload(TypedDict):
+    command: str
+    reason: str
+    at: float
+
+
+class ReconnectStatePayload(TypedDict):
+    state: str
+    attempts: int
+    retry_in_seconds: float
+    last_error: str
+
+
+class ProgramStatePayload(TypedDict):
+    state: str
+    name: str
+    segment_index: int
+    segment_count: int
+    target_speed: float | None
+    segment_remaining_seconds: float | None
+    segment_remaining_km: float | None
+    elapsed_seconds: float
+    speed_changes: int
+    error: str
+
+
+class BatchStepResult(TypedDict, total=False):
+    op: str
+    ok: bool
+    elapsed_ms: float
+    error: str
 
 
 class BackendStatusPayload(TypedDict):
@@ -24,4 +79,8 @@ class BackendStatusPayload(TypedDict):
     steps: int
     distance_km: float
     error: str
-
+    stale: bool
+    pending: PendingIntentPayload | None
+    rollback: RollbackPayload | None
+    reconnect: ReconnectStatePayload
+    program: ProgramStatePayload
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from time import monotonic
+
+try:
+    from .status_types import ProgramStatePayload
+except ImportError:
+    # Allow direct script execution (no package context)
+    from status_types import ProgramStatePayload
+
+
+PROGRAM_IDLE = "idle"
+PROGRAM_RUNNING = "running"
+PROGRAM_COMPLETED = "completed"
+PROGRAM_GOAL_REACHED = "goal_reached"
+PROGRAM_STOPPED = "stopped"
+PROGRAM_FAILED = "failed"
+
+
+@dataclass(slots=True, frozen=True)
+class ProgramSegment:
+    speed: float
+    seconds: float | None = None
+    distance_km: float | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class ProgramGoal:
+    seconds: float | None = None
+    distance_km: float | None = None
+    steps: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class WorkoutProgram:
+    name: str
+    segments: tuple[ProgramSegment, ...]
+    goal: ProgramGoal = ProgramGoal()
+    stop_at_end: bool = True
+
+    @classmethod
+    def from_dict(cls, data: dict) -> WorkoutProgram:
+        """Parse an uploaded profile; raises ValueError on invalid input.
+
+        Example::
+
+            {"name": "intervals",
+             "segments": [{"speed": 3.0, "seconds": 300}, {"speed": 4.5, "distance_km": 0.5}],
+             "goal": {"distance_km": 2.0}}
+        """
+        if not isinstance(data, dict):
+            raise ValueError("program_must_be_object")
+
+        raw_segments = data.get("segments") or []
+        if not isinstance(raw_segments, list) or not raw_segments:
+            raise ValueError("program_requires_segments")
+
+        segments = []
+        for index, raw in enumerate(raw_segments):
+            if not isinstance(raw, dict) or "speed" not in raw:
+                raise ValueError(f"segment_{index}_requires_speed")
+            seconds = _positive_or_none(raw.get("seconds"), f"segment_{index}_seconds")
+            distance_km = _positive_or_none(raw.get("distance_km"), f"segment_{index}_distance_km")
+            if (seconds is None) == (distance_km is None):
+                raise ValueError(f"segment_{index}_requires_seconds_or_distance_km")
+            segments.append(ProgramSegment(speed=float(raw["speed"]), seconds=seconds, distance_km=distance_km))
+
+        raw_goal = data.get("goal") or {}
+        if not isinstance(raw_goal, dict):
+            raise ValueError("goal_must_be_object")
+        steps = _positive_or_none(raw_goal.get("steps"), "goal_steps")
+        goal = ProgramGoal(
+            seconds=_positive_or_none(raw_goal.get("seconds"), "goal_seconds"),
+            distance_km=_positive_or_none(raw_goal.get("distance_km"), "goal_distance_km"),
+            steps=int(steps) if steps is not None else None,
+        )
+
+        return cls(
+            name=str(data.get("name", "") or "program"),
+            segments=tuple(segments),
+            goal=goal,
+            stop_at_end=bool(data.get("stop_at_end", True)),
+        )
+
+
+def _positive_or_none(value, name: str) -> float | None:
+    if value is None:
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name}_must_be_number") from None
+    if number <= 0:
+        raise ValueError(f"{name}_must_be_positive")
+    return number
+
+
+@dataclass(slots=True)
+class ProgramProgress:
+    state: str = PROGRAM_IDLE
+    name: str = ""
+    segment_index: int = -1
+    segment_count: int = 0
+    target_speed: float | None = None
+    segment_ends_at: float | None = None
+    segment_remaining_km: float | None = None
+    started_at: float | None = None
+    finished_at: float | None = None
+    speed_changes: int = 0
+    error: str = ""
+
+    def begin(self, program: WorkoutProgram) -> None:
+        self.state = PROGRAM_RUNNING
+        self.name = program.name
+        self.segment_index = -1
+        self.segment_count = len(program.segments)
+        self.target_speed = None
+        self.segment_ends_at = None
+        self.segment_remaining_km = None
+        self.started_at = monotonic()
+        self.finished_at = None
+        self.speed_changes = 0
+        self.error = ""
+
+    def finish(self, state: str, error: str = "") -> None:
+        self.state = state
+        self.error = error
+        self.finished_at = monotonic()
+        self.segment_ends_at = None
+        self.segment_remaining_km = None
+
+    def snapshot(self) -> ProgramStatePayload:
+        now = monotonic()
+        end = self.finished_at if self.finished_at is not None else now
+        segment_remaining = None
+        if self.segment_ends_at is not None:
+            segment_remaining = round(max(0.0, self.segment_ends_at - now), 1)
+        return {
+            "state": self.state,
+            "name": self.name,
+            "segment_index": self.segment_index,
+            "segment_count": self.segment_count,
+            "target_speed": self.target_speed,
+            "segment_remaining_seconds": segment_remaining,
+            "segment_remaining_km": (
+                round(self.segment_remaining_km, 3) if self.segment_remaining_km is not None else None
+            ),
+            "elapsed_seconds": round(end - self.started_at, 1) if self.started_at is not None else 0.0,
+            "speed_changes": self.speed_changes,
+            "error": self.error,
+        }
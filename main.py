@@ -2,6 +2,7 @@ import os
 
 import gi
 from gi.repository import GLib, Gtk
+from loguru import logger as log
 
 # Import StreamController modules
 from src.backend.PluginManager.ActionHolder import ActionHolder
@@ -11,9 +12,12 @@ from src.backend.DeckManagement.InputIdentifier import Input
 from src.backend.DeckManagement.ImageHelpers import image2pixbuf
 
 # Import actions
+from .actions._base.RenderCoordinator import RenderCoordinator
 from .actions.SpeedDown.SpeedDown import SpeedDown
 from .actions.SpeedUp.SpeedUp import SpeedUp
 from .actions.ToggleStartStop.ToggleStartStop import ToggleStartStop
+from .backend.startup_timing import StartupTimer
+from .backend.status_channel import StatusChannelReader
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
@@ -28,6 +32,7 @@ class MiWalkingPadPlugin(PluginBase):
     }
 
     def __init__(self):
+        self._startup = StartupTimer()
         super().__init__()
 
         self._last_saved_ip = ""
@@ -36,18 +41,29 @@ class MiWalkingPadPlugin(PluginBase):
         self._discovered_devices: list[dict] = []
         self._discovered_device_ids: list[str] = []
         self._discovery_in_progress = False
+        self.status_reader: StatusChannelReader | None = None
+        self._rpc_status: tuple[int, dict | None] = (-1, None)
+        self.render_coordinator = RenderCoordinator(self)
 
-        self._add_icons()
+        with self._startup.phase("icons"):
+            self._add_icons()
 
-        backend_path = os.path.join(self.PATH, "backend", "backend.py")
-        backend_venv = os.path.join(self.PATH, "backend", ".venv")
-        self.launch_backend(
-            backend_path=backend_path,
-            venv_path=backend_venv if os.path.isdir(backend_venv) else None,
-            open_in_terminal=False,
-        )
+        with self._startup.phase("actions"):
+            self._add_action_holders()
+
+        with self._startup.phase("register"):
+            self.register(
+                plugin_name="Mi WalkingPad",
+                github_repo="https://github.com/behesse/streamcontroller-miwalkingpad",
+                plugin_version="0.1.0",
+                app_version="1.5.0-beta.6",
+            )
 
+        # Launching the backend waits for the subprocess to connect back;
+        # keep that off StreamController's startup path.
+        GLib.Thread.new("miwalkingpad-backend-launch", self._launch_backend_worker)
 
+    def _add_action_holders(self) -> None:
         self.toggle_start_stop_action_holder = ActionHolder(
             plugin_base=self,
             action_base=ToggleStartStop,
@@ -75,14 +91,97 @@ class MiWalkingPadPlugin(PluginBase):
         )
         self.add_action_holder(self.speed_down_action_holder)
 
-        self.register(
-            plugin_name="Mi WalkingPad",
-            github_repo="https://github.com/behesse/streamcontroller-miwalkingpad",
-            plugin_version="0.1.0",
-            app_version="1.5.0-beta.6",
-        )
+    def _launch_backend_worker(self) -> None:
+        backend_path = os.path.join(self.PATH, "backend", "backend.py")
+        backend_venv = os.path.join(self.PATH, "backend", ".venv")
 
-        self._sync_backend_config()
+        try:
+            with self._startup.phase("backend_launch"):
+                self.launch_backend(
+                    backend_path=backend_path,
+                    venv_path=backend_venv if os.path.isdir(backend_venv) else None,
+                    open_in_terminal=False,
+                )
+        except Exception as exc:  # noqa: BLE001
+            log.error(f"WalkingPad backend launch failed: {exc}")
+            return
+
+        with self._startup.phase("backend_configure"):
+            self._sync_backend_config()
+
+        with self._startup.phase("status_channel"):
+            self._open_status_channel()
+
+        self.refresh_backend_status()
+        self.render_coordinator.request_render(force=True)
+
+        log.info(f"Mi WalkingPad plugin startup: {self._startup.format()}")
+
+    def _open_status_channel(self) -> None:
+        try:
+            path = self.backend.get_status_channel_path()
+            if path:
+                self.status_reader = StatusChannelReader(path)
+        except Exception as exc:  # noqa: BLE001
+            # Actions fall back to get_status() over RPC.
+            log.warning(f"WalkingPad status channel unavailable: {exc}")
+
+    def read_backend_status(self) -> tuple[int, dict | None]:
+        """Return ``(version, status)``; the version changes whenever the status may have.
+
+        Never blocks on the backend, so it is safe on the GLib main loop.
+        Without a status channel this serves the result of the last
+        refresh_backend_status().
+        """
+        if self.backend is None:
+            return -1, None
+
+        reader = self.status_reader
+        if reader is not None:
+            try:
+                status = reader.read()
+            except Exception:
+                status = None
+            if status is not None:
+                return reader.version, status
+            if not reader.alive:
+                # Backend closed the channel or died; RPC decides from here.
+                self.status_reader = None
+                reader.close()
+
+        return self._rpc_status
+
+    def refresh_backend_status(self) -> None:
+        """Poll get_status() over RPC when the status channel is unavailable.
+
+        Blocks on the backend; call it from worker or tick threads only.
+        """
+        if self.backend is None:
+            return
+        reader = self.status_reader
+        if reader is not None and reader.available:
+            return
+
+        try:
+            status = self.backend.get_status()
+        except Exception:
+            status = None
+        version, previous = self._rpc_status
+        if status != previous:
+            # No sequence number over RPC; negative versions never collide
+            # with a channel sequence.
+            version -= 1
+        self._rpc_status = (version, status)
+
+    def get_startup_report(self) -> dict:
+        report = {"plugin": self._startup.report(), "backend": None}
+        try:
+            if self.backend is not None:
+                report["backend"] = self.backend.get_startup_report()
+        except Exception:
+            # Backend may still be starting.
+            pass
+        return report
 
     def get_selector_icon(self) -> Gtk.Widget:
         return Gtk.Image.new_from_file(self.get_asset_path("icon.png"))